@@ -17,7 +17,7 @@ class MapTLA:
         TLA, CmdFct, IndxQuals, DataType, Quals = range(5)
         if len(MapTLA._d) == 0:
             path = Path(__file__).resolve().parent
-            with open(path / 'tla_mapping.csv', 'rU') as f:
+            with open(path / 'tla_mapping.csv', newline='') as f:
                 reader = csv.reader(f)
                 for row in reader:
                     if row[TLA] is not '':
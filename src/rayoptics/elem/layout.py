@@ -350,6 +350,8 @@ class ParaxialRay():
         self.handles = {}
         self.actions = self.edit_paraxial_layout_actions()
         self.vertex = None
+        self.edit_xy = None
+        self.is_edited = False
 
     def get_label(self):
         return self.label
@@ -401,21 +403,41 @@ class ParaxialRay():
         def on_select_point(fig, handle, event, info):
             self.vertex = self.seq_start
             if 'ind' in info:
-                self.vertex += info['ind'][0]
+                # select the hit vertex closest to the event location; if
+                #  no vertex is within the pick radius, a segment was hit
+                hit_list = info['ind']
+                line = self.handles['shape'].poly
+                vertex = fig.closest_vertex(line.get_xydata(), hit_list,
+                                            event, fig.pick_radius_sqr)
+                self.vertex += vertex if vertex >= 0 else hit_list[0]
             seq_model = self.opt_model.seq_model
             self.tfrm = seq_model.gbl_tfrms[self.vertex]
+            # the model is unchanged until the point moves from here
+            self.edit_xy = event.xdata, event.ydata
+            self.is_edited = False
 
         def on_edit_point(fig, handle, event, info):
-            add_event_data(self, event, handle, info)
-            self.apply_data(self.vertex, event.lcl_pt)
-            fig.refresh_gui(build='update')
+            if self.vertex is not None and event.xdata is not None:
+                add_event_data(self, event, handle, info)
+                self.apply_data(self.vertex, event.lcl_pt)
+                self.edit_xy = event.xdata, event.ydata
+                self.is_edited = True
+                fig.refresh_gui(build='update')
 
         def on_release_point(fig, handle, event, info):
-            add_event_data(self, event, handle, info)
-            self.apply_data(self.vertex, event.lcl_pt)
-            fig.refresh_gui(build='rebuild')
+            if self.vertex is not None:
+                # skip the model update if the point didn't move
+                event_xy = event.xdata, event.ydata
+                if event.xdata is not None and event_xy != self.edit_xy:
+                    add_event_data(self, event, handle, info)
+                    self.apply_data(self.vertex, event.lcl_pt)
+                    self.is_edited = True
+                if self.is_edited:
+                    fig.refresh_gui(build='rebuild')
             self.vertex = None
             self.tfrm = None
+            self.edit_xy = None
+            self.is_edited = False
 
         actions = {}
         actions['press'] = on_select_point
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" tests for editing paraxial rays in the lens layout with mouse events
+"""
+
+import unittest
+from pathlib import Path
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backend_bases import MouseEvent
+
+import rayoptics as ro
+from rayoptics.gui.appcmds import open_model
+from rayoptics.mpl.interactivelayout import InteractiveLayout
+
+
+class EditParaxialRayTestCase(unittest.TestCase):
+    """ drive paraxial ray edits on an InteractiveLayout with synthetic events
+    """
+
+    def setUp(self):
+        root_pth = Path(ro.__file__).resolve().parent
+        self.opm = open_model(root_pth/'codev/tests/ag_dblgauss.seq')
+        self.builds = []
+
+        def refresh_gui(**kwargs):
+            self.builds.append(kwargs.get('build'))
+            self.fig.refresh(**kwargs)
+            self.fig.canvas.draw()
+
+        self.fig = InteractiveLayout(self.opm, refresh_gui=refresh_gui,
+                                     do_paraxial_layout=True, figsize=(6, 4))
+        FigureCanvasAgg(self.fig)
+        self.fig.plot()
+        self.fig.canvas.draw()
+        self.ray = self.fig.parax_shapes[0]
+
+    def event(self, name, pt, button=1):
+        x, y = self.fig.ax.transData.transform(pt)
+        return MouseEvent(name, self.fig.canvas, x, y, button=button)
+
+    def powers(self):
+        return [ifc.optical_power for ifc in self.opm.seq_model.ifcs]
+
+    def select_vertex(self, vertex):
+        pt = self.ray.handles['shape'].poly.get_xydata()[vertex]
+        self.fig.on_motion(self.event('motion_notify_event', pt, None))
+        self.assertIs(self.fig.hilited.artist.shape[0], self.ray)
+        self.fig.on_press(self.event('button_press_event', pt))
+        self.assertEqual(self.ray.vertex, self.ray.seq_start + vertex)
+        return pt
+
+    def drag_vertex(self, vertex):
+        pt = self.select_vertex(vertex)
+        new_pt = np.array([pt[0], 1.1*pt[1]])
+        self.fig.on_motion(self.event('motion_notify_event', new_pt))
+        return new_pt
+
+    def test_release_without_move(self):
+        pt = self.select_vertex(3)
+        powers = self.powers()
+        self.fig.on_release(self.event('button_release_event', pt))
+        self.assertEqual(self.builds, [])
+        self.assertEqual(self.powers(), powers)
+        self.assertIsNone(self.ray.vertex)
+
+    def test_drag_and_release(self):
+        powers = self.powers()
+        new_pt = self.drag_vertex(3)
+        self.fig.on_release(self.event('button_release_event', new_pt))
+        self.assertEqual(self.builds, ['update', 'rebuild'])
+        self.assertNotEqual(self.powers(), powers)
+
+    def test_release_outside_axes(self):
+        self.drag_vertex(3)
+        event = MouseEvent('button_release_event', self.fig.canvas, 0, 0,
+                           button=1)
+        self.assertIsNone(event.xdata)
+        self.fig.on_release(event)
+        self.assertEqual(self.builds, ['update', 'rebuild'])
+        self.assertIsNone(self.ray.vertex)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=3)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Test the numba kernels in gui.util against their numpy fallbacks
+"""
+
+
+import unittest
+
+import numpy as np
+
+from rayoptics.gui import util
+
+
+class ArgminSqdistTestCase(unittest.TestCase):
+    """Test that the compiled and numpy versions of argmin_sqdist agree"""
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.pts = rng.uniform(-10., 10., size=(40, 2))
+        self.queries = [(0., 0.), (3.5, -2.), (12., 12.), (-9., 9.5),
+                        tuple(self.pts[5] + 0.05)]
+        self.radii = [np.inf, 1.0, 0.01]
+
+    def tearDown(self):
+        util._jit_kernels.pop(util._argmin_sqdist, None)
+
+    def search(self, pts, compiled):
+        if compiled:
+            util._jit_kernels.pop(util._argmin_sqdist, None)
+        else:
+            util._jit_kernels[util._argmin_sqdist] = None
+        return [util.argmin_sqdist(pts, qx, qy, radius_sqr)
+                for qx, qy in self.queries for radius_sqr in self.radii]
+
+    def test_numpy_fallback(self):
+        results = self.search(self.pts, compiled=False)
+        for (qx, qy) in self.queries:
+            d2_all = ((self.pts - (qx, qy))**2).sum(axis=1)
+            for radius_sqr in self.radii:
+                i, d2 = results.pop(0)
+                if d2_all.min() > radius_sqr:
+                    self.assertEqual((i, d2), (-1, radius_sqr))
+                else:
+                    self.assertEqual(i, d2_all.argmin())
+                    self.assertAlmostEqual(d2, d2_all.min())
+
+    def test_empty(self):
+        pts = np.empty((0, 2))
+        for compiled in (True, False):
+            for result, radius_sqr in zip(self.search(pts, compiled),
+                                          self.radii*len(self.queries)):
+                self.assertEqual(result, (-1, radius_sqr))
+
+    def test_parity(self):
+        if util._jit(util._argmin_sqdist) is None:
+            self.skipTest("numba is not installed")
+        compiled = self.search(self.pts, compiled=True)
+        fallback = self.search(self.pts, compiled=False)
+        for (i_c, d2_c), (i_f, d2_f) in zip(compiled, fallback):
+            self.assertEqual(i_c, i_f)
+            self.assertAlmostEqual(d2_c, d2_f)
+
+
+class BBoxCandidatesTestCase(unittest.TestCase):
+    """Test that the compiled and numpy versions of bbox_candidates agree"""
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        corners = rng.uniform(0., 10., size=(60, 2))
+        sizes = rng.uniform(0., 4., size=(60, 2))
+        self.bboxes = np.hstack((corners, corners + sizes))
+        self.queries = [(5., 5.), (0., 0.), (20., 20.),
+                        tuple(self.bboxes[7, :2])]
+
+    def tearDown(self):
+        util._jit_kernels.pop(util._bbox_candidates, None)
+
+    def search(self, bboxes, compiled):
+        if compiled:
+            util._jit_kernels.pop(util._bbox_candidates, None)
+        else:
+            util._jit_kernels[util._bbox_candidates] = None
+        return [util.bbox_candidates(bboxes, ex, ey)
+                for ex, ey in self.queries]
+
+    def test_numpy_fallback(self):
+        bb = self.bboxes
+        for (ex, ey), hits in zip(self.queries,
+                                  self.search(bb, compiled=False)):
+            self.assertEqual(hits.dtype, np.int32)
+            expected = [i for i in range(len(bb))
+                        if bb[i, 0] <= ex <= bb[i, 2] and
+                        bb[i, 1] <= ey <= bb[i, 3]]
+            self.assertEqual(hits.tolist(), expected)
+
+    def test_empty(self):
+        bboxes = np.empty((0, 4))
+        for compiled in (True, False):
+            for hits in self.search(bboxes, compiled):
+                self.assertEqual(hits.dtype, np.int32)
+                self.assertEqual(len(hits), 0)
+
+    def test_parity(self):
+        if util._jit(util._bbox_candidates) is None:
+            self.skipTest("numba is not installed")
+        compiled = self.search(self.bboxes, compiled=True)
+        fallback = self.search(self.bboxes, compiled=False)
+        for hits_c, hits_f in zip(compiled, fallback):
+            self.assertEqual(hits_c.dtype, np.int32)
+            self.assertEqual(hits_c.tolist(), hits_f.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=3)
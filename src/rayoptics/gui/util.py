@@ -31,6 +31,118 @@ def bbox_from_poly(poly):
     return np.array([[minx, miny], [maxx, maxy]])
 
 
+_jit_kernels = {}
+
+
+def _jit(fct):
+    """ returns a numba compiled version of fct, or None if numba is missing
+
+    numba is an optional dependency; it is imported the first time a compiled
+    kernel is requested.
+    """
+    try:
+        return _jit_kernels[fct]
+    except KeyError:
+        try:
+            from numba import njit
+        except ImportError:
+            kernel = None
+        else:
+            kernel = njit(cache=True)(fct)
+        _jit_kernels[fct] = kernel
+        return kernel
+
+
+def _argmin_sqdist(pts, qx, qy, radius_sqr):
+    best_idx = -1
+    best_d = np.inf
+    for i in range(pts.shape[0]):
+        dx = pts[i, 0] - qx
+        dy = pts[i, 1] - qy
+        d = dx*dx + dy*dy
+        if d < best_d:
+            best_idx = i
+            best_d = d
+    if best_d > radius_sqr:
+        return -1, radius_sqr
+    return best_idx, best_d
+
+
+def argmin_sqdist(pts, qx, qy, radius_sqr=np.inf):
+    """ find the point in pts closest to the query point (qx, qy)
+
+    A numba compiled kernel is used if numba is installed, otherwise the
+    search is done with numpy.
+
+    Args:
+        pts: a (N, 2) array of points
+        qx: x coordinate of the query point
+        qy: y coordinate of the query point
+        radius_sqr: only points within this distance squared are candidates
+
+    Returns:
+        (index, distance squared) of the closest point, or (-1, radius_sqr)
+        if no point is within radius_sqr of the query point
+    """
+    kernel = _jit(_argmin_sqdist)
+    if kernel is not None:
+        return kernel(np.ascontiguousarray(pts, dtype=np.float64),
+                      float(qx), float(qy), float(radius_sqr))
+    if len(pts) == 0:
+        return -1, radius_sqr
+    d2 = ((pts - np.array([qx, qy], dtype=np.float64))**2).sum(axis=1)
+    i = d2.argmin()
+    if d2[i] > radius_sqr:
+        return -1, radius_sqr
+    return i, d2[i]
+
+
+def _bbox_candidates(bboxes, ex, ey):
+    hits = np.empty(bboxes.shape[0], dtype=np.int32)
+    n = 0
+    for i in range(bboxes.shape[0]):
+        if (bboxes[i, 0] <= ex <= bboxes[i, 2] and
+                bboxes[i, 1] <= ey <= bboxes[i, 3]):
+            hits[n] = i
+            n += 1
+    return hits[:n]
+
+
+def bbox_candidates(bboxes, ex, ey):
+    """ find the bounding boxes that contain the point (ex, ey)
+
+    A numba compiled kernel is used if numba is installed, otherwise the
+    test is done with a numpy mask. Compiling the kernel takes most of a
+    second the first time; call compile_kernels() ahead of time to keep it
+    out of the first mouse event.
+
+    Args:
+        bboxes: a (N, 4) array of x0, y0, x1, y1 extents
+        ex: x coordinate of the query point
+        ey: y coordinate of the query point
+
+    Returns:
+        int32 array of the indices of the bboxes containing the point
+    """
+    kernel = _jit(_bbox_candidates)
+    if kernel is not None:
+        return kernel(np.ascontiguousarray(bboxes, dtype=np.float64),
+                      float(ex), float(ey))
+    inside = ((ex >= bboxes[:, 0]) & (ex <= bboxes[:, 2]) &
+              (ey >= bboxes[:, 1]) & (ey <= bboxes[:, 3]))
+    return np.flatnonzero(inside).astype(np.int32)
+
+
+def compile_kernels():
+    """ compile the numba kernels, if numba is installed
+
+    numba compiles a kernel the first time it is called; the compiled code
+    is cached on disk for later sessions.
+    """
+    bbox_candidates(np.empty((0, 4)), 0., 0.)
+    argmin_sqdist(np.empty((0, 2)), 0., 0.)
+
+
 def scale_bounds(bbox, oversize_factor):
     inc_x = oversize_factor*(bbox[1][0] - bbox[0][0])
     inc_y = oversize_factor*(bbox[1][1] - bbox[0][1])
@@ -10,6 +10,7 @@
 
 import logging
 from collections import namedtuple
+from numbers import Number
 
 import numpy as np
 from matplotlib import lines
@@ -76,6 +77,10 @@ class InteractiveFigure(StyledFigure):
 
         self.do_action = self.do_shape_action
         self.event_dict = {}
+        self.pick_radius_sqr = np.inf
+        self._artist_bboxes = None
+        self._shape_artists = []
+        self._renderer = None
 
         self.on_finished = None
 
@@ -100,6 +105,67 @@ class InteractiveFigure(StyledFigure):
             cid = self.canvas.mpl_connect(event, action)
             self.callback_ids.append(cid)
 
+    def connect_view_events(self):
+        'connect to the events that change the rendered view'
+        self.ax.callbacks.connect('xlim_changed',
+                                  self.invalidate_display_cache)
+        self.ax.callbacks.connect('ylim_changed',
+                                  self.invalidate_display_cache)
+        self.canvas.mpl_connect('draw_event', self.invalidate_display_cache)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+    def on_draw(self, event):
+        """ save the renderer of the last draw for the hit test extents """
+        if event.canvas.is_saving():
+            return
+        self._renderer = event.renderer
+
+    def invalidate_display_cache(self, *args):
+        self._artist_bboxes = None
+
+    def update_artist_bboxes(self, renderer):
+        """ save the shape artists and their display extents in arrays
+
+        The extents are padded by the pick radius of the artist, so that they
+        bound the region where the artist's contains() method can succeed.
+        """
+        self._shape_artists = [a for a in self.ax.get_children()
+                               if hasattr(a, 'shape')]
+        scale = max(1., self.dpi/72)
+        bboxes = np.empty((len(self._shape_artists), 4))
+        for i, a in enumerate(self._shape_artists):
+            picker = a.get_picker()
+            pad = picker if isinstance(picker, Number) else 0.
+            pad = scale*max(pad, a.get_linewidth()) + 1.
+            x0, y0, x1, y1 = a.get_window_extent(renderer).extents
+            bboxes[i] = x0 - pad, y0 - pad, x1 + pad, y1 + pad
+        self._artist_bboxes = bboxes
+
+    def closest_vertex(self, xy_data, hit_list, event,
+                       pick_radius_sqr=np.inf):
+        """ returns the vertex in hit_list closest to the event location
+
+        Args:
+            xy_data: (N, 2) array of vertices, in data coordinates
+            hit_list: indices into xy_data of the candidate vertices
+            event: the mouse event
+            pick_radius_sqr: only vertices within this distance squared of
+                             the event, in display coordinates, are candidates
+
+        Returns:
+            index into xy_data of the closest vertex, or -1 if there is no
+            vertex within the pick radius
+        """
+        if len(hit_list) == 1:
+            vertex = hit_list[0]
+            x, y = self.ax.transData.transform(xy_data[vertex])
+            dx, dy = x - event.x, y - event.y
+            return vertex if dx*dx + dy*dy <= pick_radius_sqr else -1
+
+        xy_disp = self.ax.transData.transform(np.asarray(xy_data)[hit_list])
+        i, _ = util.argmin_sqdist(xy_disp, event.x, event.y, pick_radius_sqr)
+        return hit_list[i] if i >= 0 else -1
+
     def disconnect_events(self):
         'disconnect all the stored connection ids'
         for clbk in self.callback_ids:
@@ -175,11 +241,8 @@ class InteractiveFigure(StyledFigure):
                 # add shape and handle key as attribute on artist
                 poly.shape = (shape, key)
                 self.artists.append(poly)
-                if len(bbox_list) == 0:
-                    bbox_list = bbox
-                else:
-                    bbox_list = np.vstack((bbox_list, bbox))
-        bbox = util.bbox_from_poly(bbox_list)
+                bbox_list.append(np.asarray(bbox))
+        bbox = util.bbox_from_poly(np.concatenate(bbox_list, axis=0))
         return bbox
 
     def create_patches(self, handles):
@@ -327,8 +390,8 @@ class InteractiveFigure(StyledFigure):
         return p
 
     def update_axis_limits(self, bbox):
-        self.ax.set_xlim(bbox[0][0], bbox[1][0])
-        self.ax.set_ylim(bbox[0][1], bbox[1][1])
+        self.ax.set(xlim=(bbox[0][0], bbox[1][0]),
+                    ylim=(bbox[0][1], bbox[1][1]))
 
     def fit_axis_limits(self):
         """ returns a numpy bounding box that fits the current data """
@@ -355,8 +418,9 @@ class InteractiveFigure(StyledFigure):
         view_bbox = np.array([[cen_x-hlf_x, cen_y-hlf_y],
                               [cen_x+hlf_x, cen_y+hlf_y]])
 
+        # only the axis limits change, the artists don't need replotting
         self.set_view_bbox(view_bbox)
-        self.plot()
+        self.canvas.draw_idle()
 
     def zoom_in(self):
         self.zoom(factor=0.8)
@@ -392,8 +456,11 @@ class InteractiveFigure(StyledFigure):
         except AttributeError:
             self.ax = self.add_subplot(1, 1, 1, aspect=self.aspect)
 
+        pick_radius = 5
+        # pick radius is in points, hit tests are done in display coords
+        self.pick_radius_sqr = (self.dpi/72*pick_radius)**2
         for a in self.artists:
-            a.set_picker(5)
+            a.set_picker(pick_radius)
             if isinstance(a, lines.Line2D):
                 self.ax.add_line(a)
             elif isinstance(a, patches.Patch):
@@ -413,6 +480,10 @@ class InteractiveFigure(StyledFigure):
 
         self.draw_axes(self.do_draw_axes)
 
+        self.invalidate_display_cache()
+        self.connect_view_events()
+        # compile the hit test kernels now rather than on the first hover
+        util.compile_kernels()
         self.connect_events()
         self.canvas.draw_idle()
 
@@ -420,23 +491,38 @@ class InteractiveFigure(StyledFigure):
 
     def find_artists_at_location(self, event):
         """Returns a list of shapes in zorder at the event location."""
+        if self._artist_bboxes is None and self._renderer is not None:
+            self.update_artist_bboxes(self._renderer)
+
+        if self._artist_bboxes is None:
+            candidates = [a for a in self.ax.get_children()
+                          if hasattr(a, 'shape')]
+        else:
+            # only test artists whose padded extent includes the event
+            candidates = [self._shape_artists[i] for i in
+                          util.bbox_candidates(self._artist_bboxes,
+                                               event.x, event.y)]
+
+        is_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
         artists = []
-        for artist in self.ax.get_children():
-            if hasattr(artist, 'shape'):
-                inside, info = artist.contains(event)
-                if inside:
+        for artist in candidates:
+            inside, info = artist.contains(event)
+            if inside:
+                artists.append(SelectInfo(artist, info))
+                if is_debug:
                     shape, handle = artist.shape
-                    artists.append(SelectInfo(artist, info))
                     if 'ind' in info:
-                        logging.debug("on motion, artist {}: {}.{}, z={}, "
-                                      "hits={}".format(len(artists),
+                        logging.debug("on motion, artist %d: %s.%s, z=%s, "
+                                      "hits=%s", len(artists),
                                       shape.get_label(), handle,
-                                      artist.get_zorder(), info['ind']))
+                                      artist.get_zorder(), info['ind'])
                     else:
-                        logging.debug("on motion, artist {}: {}.{}, z={}"
-                                      .format(len(artists), shape.get_label(),
-                                              handle, artist.get_zorder()))
+                        logging.debug("on motion, artist %d: %s.%s, z=%s",
+                                      len(artists), shape.get_label(),
+                                      handle, artist.get_zorder())
 
+        if len(artists) <= 1:
+            return artists
         return sorted(artists, key=lambda a: a.artist.get_zorder(),
                       reverse=True)
 
@@ -482,12 +568,11 @@ class InteractiveFigure(StyledFigure):
             nxt_art = next_hilited.artist if next_hilited is not None else None
             if nxt_art is not cur_art:
                 if self.hilited:
-                    self.hilited.artist.unhighlight(self.hilited.artist)
-                    self.hilited.artist.figure.canvas.draw()
+                    cur_art.unhighlight(cur_art)
                 if next_hilited:
-                    next_hilited.artist.highlight(next_hilited.artist)
-                    next_hilited.artist.figure.canvas.draw()
+                    nxt_art.highlight(nxt_art)
                 self.hilited = next_hilited
+                self.canvas.draw_idle()
                 if next_hilited is None:
                     logging.debug("hilite_change: no object found")
                 else:
@@ -498,9 +583,10 @@ class InteractiveFigure(StyledFigure):
         else:
             # display_artist_and_event('on_drag', event, self.selected.artist)
             self.do_action(event, self.selected, 'drag')
-            shape, handle = self.selected.artist.shape
-            logging.debug("on_drag: %s %s %d", shape.get_label(), handle,
-                          self.selected.artist.get_zorder())
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                shape, handle = self.selected.artist.shape
+                logging.debug("on_drag: %s %s %d", shape.get_label(), handle,
+                              self.selected.artist.get_zorder())
 
     def on_release(self, event):
         'on release we reset the press data'
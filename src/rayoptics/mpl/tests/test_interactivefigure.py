@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" tests for hiliting shapes in an InteractiveFigure with mouse events
+"""
+
+import unittest
+from pathlib import Path
+
+import numpy as np
+from matplotlib import patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backend_bases import MouseEvent
+
+import rayoptics as ro
+from rayoptics.gui.appcmds import open_model
+from rayoptics.mpl.interactivelayout import InteractiveLayout
+
+
+class HiliteTestCase(unittest.TestCase):
+    """ compare the rendering of a hovered shape with a plain redraw """
+
+    def setUp(self):
+        root_pth = Path(ro.__file__).resolve().parent
+        opm = open_model(root_pth/'codev/tests/ag_dblgauss.seq')
+        self.fig = InteractiveLayout(opm, refresh_gui=None, figsize=(6, 4))
+        FigureCanvasAgg(self.fig)
+        self.fig.plot()
+
+    def render(self):
+        self.fig.canvas.draw()
+        return np.array(self.fig.canvas.buffer_rgba())
+
+    def hover(self, x, y):
+        event = MouseEvent('motion_notify_event', self.fig.canvas, x, y)
+        self.fig.on_motion(event)
+
+    def test_hilite_polygon(self):
+        img0 = self.render()
+
+        # hover over the first lens element, away from the rays
+        lens = next(a for a in self.fig.artists
+                    if isinstance(a, patches.Polygon))
+        xy = self.fig.ax.transData.transform(lens.get_xy())
+        x = xy[:, 0].mean()
+        for y in np.linspace(xy[:, 1].min(), xy[:, 1].max(), 41):
+            self.hover(x, y)
+            if self.fig.hilited and self.fig.hilited.artist is lens:
+                break
+        self.assertIs(self.fig.hilited.artist, lens)
+        img_hover = self.render()
+        self.assertFalse(np.array_equal(img_hover, img0))
+
+        # moving off the lens restores the original rendering
+        x0, y0 = self.fig.ax.bbox.p0
+        self.hover(x0 + 1, y0 + 1)
+        self.assertIsNone(self.fig.hilited)
+        np.testing.assert_array_equal(self.render(), img0)
+
+        # the hovered rendering matches a plain redraw of the hilited lens
+        lens.highlight(lens)
+        np.testing.assert_array_equal(self.render(), img_hover)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=3)
@@ -18,7 +18,7 @@ from rayoptics.gui.util import GUIHandle, bbox_from_poly, fit_data_range
 from rayoptics.optical.model_constants import ht, slp
 from rayoptics.optical.model_constants import pwr, tau, indx, rmd
 from rayoptics.util.rgb2mpl import rgb2mpl
-from rayoptics.util.misc_math import (normalize, distance_sqr_2d,
+from rayoptics.util.misc_math import (normalize,
                                       projected_point_on_radial_line)
 from rayoptics.util.line_intersection import get_intersect
 from rayoptics.util import misc_math
@@ -246,8 +246,8 @@ class Diagram():
 
     def fit_axis_limits(self):
         ''' define diagram axis limits as the extent of the shape polygon '''
-        x_min, x_max = fit_data_range([x[0] for x in self.shape])
-        y_min, y_max = fit_data_range([x[1] for x in self.shape])
+        x_min, x_max = fit_data_range(self.shape[:, 0].tolist())
+        y_min, y_max = fit_data_range(self.shape[:, 1].tolist())
         return np.array([[x_min, y_min], [x_max, y_max]])
 
 
@@ -598,6 +598,8 @@ class EditNodeAction():
         self.pt0 = None
         self.pt2 = None
         self.filter = filter
+        self.edit_xy = None
+        self.is_edited = False
 
         def point_on_line(pt1, pt2, t):
             d = pt2 - pt1
@@ -644,27 +646,38 @@ class EditNodeAction():
                 self.pt0 = point_on_line(pt0, pt1, buffer_fraction)
                 pt2 = diagram.shape[self.cur_node+1]
                 self.pt2 = point_on_line(pt1, pt2, 1-buffer_fraction)
+            # the node is unchanged until the point moves from here
+            self.edit_xy = event.xdata, event.ydata
+            self.is_edited = False
+
+        def apply_event_data(event):
+            event_data = np.array([event.xdata, event.ydata])
+            if self.filter:
+                event_data = self.filter(event_data)
+            event_data = constrain_to_wedge(event_data)
+            diagram.apply_data(self.cur_node, event_data)
+            self.edit_xy = event.xdata, event.ydata
+            self.is_edited = True
 
         def on_edit(fig, event):
-            if event.xdata is not None and event.ydata is not None:
-                event_data = np.array([event.xdata, event.ydata])
-                if self.filter:
-                    event_data = self.filter(event_data)
-                event_data = constrain_to_wedge(event_data)
-                diagram.apply_data(self.cur_node, event_data)
+            if self.cur_node is not None and \
+               event.xdata is not None and event.ydata is not None:
+                apply_event_data(event)
                 fig.build = 'update'
                 fig.refresh_gui(build='update')
 
         def on_release(fig, event):
-            if event.xdata is not None and event.ydata is not None:
-                event_data = np.array([event.xdata, event.ydata])
-                if self.filter:
-                    event_data = self.filter(event_data)
-                event_data = constrain_to_wedge(event_data)
-                diagram.apply_data(self.cur_node, event_data)
-                fig.build = 'rebuild'
-                fig.refresh_gui(build='rebuild')
-                self.cur_node = None
+            if self.cur_node is not None:
+                # skip the model update if the point didn't move
+                if event.xdata is not None and event.ydata is not None and \
+                   (event.xdata, event.ydata) != self.edit_xy:
+                    apply_event_data(event)
+                if self.is_edited:
+                    fig.build = 'rebuild'
+                    fig.refresh_gui(build='rebuild')
+            self.cur_node = None
+            self.edit_xy = None
+            self.is_edited = False
 
         self.actions = {}
         self.actions['drag'] = on_edit
@@ -825,16 +838,13 @@ class EditBendingAction():
             shape = diagram.shape
             self.node = node = dgm_edge.node
             if node > 0 and node < (len(shape)-2):
-                inpt = np.array([event.xdata, event.ydata])
                 # get the virtual vertex of the combined element surfaces
                 vertex = np.array(get_intersect(shape[node-1], shape[node],
                                                 shape[node+1], shape[node+2]))
                 edge_dir_01 = normalize(shape[node] - shape[node-1])
                 edge_dir_23 = normalize(shape[node+2] - shape[node+1])
                 # which node is closer to the input point?
-                pt1_dist = distance_sqr_2d(shape[node], inpt)
-                pt2_dist = distance_sqr_2d(shape[node+1], inpt)
-                if pt1_dist < pt2_dist:
+                if fig.closest_vertex(shape, [node, node+1], event) == node:
                     self.filter = calc_coef_fct(vertex, node, edge_dir_01,
                                                 node+1, edge_dir_23)
                 else:
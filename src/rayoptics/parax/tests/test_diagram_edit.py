@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" tests for editing diagram nodes with mouse events
+"""
+
+import unittest
+from pathlib import Path
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backend_bases import MouseEvent
+
+import rayoptics as ro
+from rayoptics.gui.appcmds import open_model
+from rayoptics.gui import util
+from rayoptics.mpl.interactivediagram import InteractiveDiagram
+
+
+class EditNodeTestCase(unittest.TestCase):
+    """ drive node edits on an InteractiveDiagram with synthetic events """
+
+    def setUp(self):
+        root_pth = Path(ro.__file__).resolve().parent
+        self.opm = open_model(root_pth/'codev/tests/singlet.seq')
+        self.builds = []
+
+        def refresh_gui(**kwargs):
+            self.builds.append(kwargs.get('build'))
+            self.fig.refresh(**kwargs)
+            self.fig.canvas.draw()
+
+        self.fig = InteractiveDiagram(self.opm, 'ht', refresh_gui=refresh_gui,
+                                      enable_slide=True, figsize=(6, 4))
+        FigureCanvasAgg(self.fig)
+        self.fig.plot()
+        # the default view truncates the object distance; show all the nodes
+        bbox = util.bbox_from_poly(self.fig.diagram.shape)
+        self.fig.set_view_bbox(util.scale_bounds(bbox, 0.1))
+        self.fig.canvas.draw()
+        self.fig.diagram.register_commands((), figure=self.fig)
+        self.node = len(self.fig.diagram.shape) - 1
+
+    def event(self, name, pt, button=1):
+        x, y = self.fig.ax.transData.transform(pt)
+        return MouseEvent(name, self.fig.canvas, x, y, button=button)
+
+    def select_node(self, node):
+        pt = self.fig.diagram.shape[node]
+        self.fig.on_motion(self.event('motion_notify_event', pt, None))
+        shape, handle = self.fig.hilited.artist.shape
+        self.assertIs(shape, self.fig.diagram.node_list[node])
+        self.fig.on_press(self.event('button_press_event', pt))
+        return pt
+
+    def drag_node(self, node):
+        pt = self.select_node(node)
+        new_pt = 1.05*pt
+        self.fig.on_motion(self.event('motion_notify_event', new_pt))
+        return new_pt
+
+    def test_release_without_move(self):
+        pt = self.select_node(self.node)
+        ax = np.copy(self.opm.parax_model.ax)
+        self.fig.on_release(self.event('button_release_event', pt))
+        self.assertEqual(self.builds, [])
+        np.testing.assert_array_equal(self.opm.parax_model.ax, ax)
+
+    def test_drag_and_release(self):
+        pt = self.fig.diagram.shape[self.node].copy()
+        new_pt = self.drag_node(self.node)
+        self.fig.on_release(self.event('button_release_event', new_pt))
+        self.assertEqual(self.builds, ['update', 'rebuild'])
+        self.assertFalse(np.allclose(self.fig.diagram.shape[self.node], pt))
+
+    def test_release_outside_axes(self):
+        self.drag_node(self.node)
+        event = MouseEvent('button_release_event', self.fig.canvas, 0, 0,
+                           button=1)
+        self.assertIsNone(event.xdata)
+        self.fig.on_release(event)
+        self.assertEqual(self.builds, ['update', 'rebuild'])
+
+    def test_edit_node_0(self):
+        pt = self.fig.diagram.shape[0].copy()
+        new_pt = self.drag_node(0)
+        self.fig.on_release(self.event('button_release_event', new_pt))
+        self.assertEqual(self.builds, ['update', 'rebuild'])
+        self.assertFalse(np.allclose(self.fig.diagram.shape[0], pt))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=3)
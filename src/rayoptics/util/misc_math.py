@@ -23,7 +23,9 @@ def normalize(v):
 
 def distance_sqr_2d(pt0, pt1):
     """ return distance squared between 2d points pt0 and pt1 """
-    return (pt0[0] - pt1[0])**2 + (pt0[1] - pt1[1])**2
+    dx = pt0[0] - pt1[0]
+    dy = pt0[1] - pt1[1]
+    return dx*dx + dy*dy
 
 
 def perpendicular_distance_2d(pt, pt1, pt2):
@@ -44,10 +46,7 @@ def perpendicular_to_radial(pt, pt2):
 def perpendicular_to_line(pt, pt1, pt2):
     """ return perpendicular distance of pt from the line between pt1 and pt2
     """
-    d = perpendicular_distance_2d(pt, pt1, pt2)
-    return (((pt2[0] - pt1[0])*(pt1[1] - pt[1])
-            - (pt1[0] - pt[0])*(pt2[1] - pt1[1]))
-            / sqrt(distance_sqr_2d(pt2, pt1)))
+    return perpendicular_distance_2d(pt, pt1, pt2)
 
 
 def perpendicular_from_origin(pt1, pt2):